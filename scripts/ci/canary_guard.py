@@ -10,9 +10,37 @@ import re
 import sys
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional accelerator; stdlib json is the fallback
+    orjson = None
+
+UTC = dt.timezone.utc
+
 SEMVER_TAG_RE = re.compile(r"^v\d+\.\d+\.\d+([.-][0-9A-Za-z.-]+)?$")
 
 
+def load_json(path: Path) -> object:
+    raw = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def write_json(path: Path, payload: object) -> None:
+    if orjson is not None:
+        path.write_bytes(
+            orjson.dumps(
+                payload,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS,
+            )
+        )
+        return
+    with path.open("w", encoding="utf-8") as handle:
+        json.dump(payload, handle, indent=2, ensure_ascii=False)
+        handle.write("\n")
+
+
 def parse_string_list(raw: object, *, field: str, violations: list[str]) -> list[str]:
     if raw is None:
         return []
@@ -91,33 +119,36 @@ def build_markdown(report: dict) -> str:
 
     if report["cohorts"]:
         lines.append("## Cohorts")
-        for item in report["cohorts"]:
-            lines.append(
-                f"- `{item['name']}`: {item['traffic_percent']}% traffic for {item['duration_minutes']} minutes"
-            )
+        lines.extend(
+            f"- `{item['name']}`: {item['traffic_percent']}% traffic for {item['duration_minutes']} minutes"
+            for item in report["cohorts"]
+        )
         lines.append("")
 
     if report["observability_signals"]:
         lines.append("## Observability Signals")
-        for signal in report["observability_signals"]:
-            lines.append(f"- `{signal}`")
+        lines.extend(f"- `{signal}`" for signal in report["observability_signals"])
         lines.append("")
 
     if report["violations"]:
         lines.append("## Violations")
-        for item in report["violations"]:
-            lines.append(f"- {item}")
+        lines.extend(f"- {item}" for item in report["violations"])
         lines.append("")
 
     if report["warnings"]:
         lines.append("## Warnings")
-        for item in report["warnings"]:
-            lines.append(f"- {item}")
+        lines.extend(f"- {item}" for item in report["warnings"])
         lines.append("")
 
     return "\n".join(lines).rstrip() + "\n"
 
 
+def print_violations(violations: list[str]) -> None:
+    print("canary guard violations found:", file=sys.stderr)
+    for item in violations:
+        print(f"- {item}", file=sys.stderr)
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Evaluate canary metrics and decide promote/hold/abort.")
     parser.add_argument("--policy-file", required=True)
@@ -131,9 +162,14 @@ def main() -> int:
     parser.add_argument("--output-json", required=True)
     parser.add_argument("--output-md", required=True)
     parser.add_argument("--fail-on-violation", action="store_true")
+    parser.add_argument(
+        "--exit-only",
+        action="store_true",
+        help="With --fail-on-violation, skip writing report artifacts when violations are found",
+    )
     args = parser.parse_args()
 
-    policy = json.loads(Path(args.policy_file).read_text(encoding="utf-8"))
+    policy = load_json(Path(args.policy_file))
     violations: list[str] = []
     warnings: list[str] = []
 
@@ -179,11 +215,15 @@ def main() -> int:
     if violations:
         decision = "hold"
 
+    if args.exit_only and args.fail_on_violation and violations:
+        print_violations(violations)
+        return 3
+
     ready_to_execute = args.mode == "execute" and decision in {"promote", "abort"} and not violations
 
     report = {
         "schema_version": "zeroclaw.canary-guard.v1",
-        "generated_at": dt.datetime.now(dt.timezone.utc).isoformat(),
+        "generated_at": dt.datetime.now(UTC).isoformat(),
         "policy_schema_version": policy.get("schema_version"),
         "candidate_tag": args.candidate_tag,
         "candidate_sha": args.candidate_sha or None,
@@ -218,13 +258,11 @@ def main() -> int:
     output_md = Path(args.output_md)
     output_json.parent.mkdir(parents=True, exist_ok=True)
     output_md.parent.mkdir(parents=True, exist_ok=True)
-    output_json.write_text(json.dumps(report, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
-    output_md.write_text(build_markdown(report), encoding="utf-8")
+    write_json(output_json, report)
+    output_md.write_bytes(build_markdown(report).encode("utf-8"))
 
     if args.fail_on_violation and violations:
-        print("canary guard violations found:", file=sys.stderr)
-        for item in violations:
-            print(f"- {item}", file=sys.stderr)
+        print_violations(violations)
         return 3
     return 0
 
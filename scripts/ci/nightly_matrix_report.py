@@ -6,24 +6,76 @@ from __future__ import annotations
 import argparse
 import datetime as dt
 import json
+import os
 import sys
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional accelerator; stdlib json is the fallback
+    orjson = None
+
+UTC = dt.timezone.utc
+
+
+def load_json(path: Path) -> object:
+    raw = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def write_json(path: Path, payload: object) -> None:
+    if orjson is not None:
+        path.write_bytes(
+            orjson.dumps(
+                payload,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS,
+            )
+        )
+        return
+    with path.open("w", encoding="utf-8") as handle:
+        json.dump(payload, handle, indent=2, ensure_ascii=False)
+        handle.write("\n")
+
 
 def load_owner_map(path: str | None) -> dict[str, str]:
     if not path:
         return {}
-    raw = json.loads(Path(path).read_text(encoding="utf-8"))
+    raw = load_json(Path(path))
     owners = raw.get("owners", {})
     if not isinstance(owners, dict):
         raise ValueError("owners file must contain an object at key 'owners'")
     return {str(k): str(v) for k, v in owners.items()}
 
 
+def iter_lane_result_paths(root: Path) -> Iterator[str]:
+    # Walk with scandir so non-matching entries never become Path objects and
+    # DirEntry type info avoids extra stat calls. Like rglob, symlinked dirs are not followed.
+    pending = [str(root)]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.name.startswith("nightly-result-") and entry.name.endswith(".json"):
+                    yield entry.path
+
+
+def load_lane_results(paths: list[Path]) -> list[tuple[Path, object]]:
+    if not paths:
+        return []
+    max_workers = min(32, (os.cpu_count() or 4) * 4, len(paths))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(lambda path: (path, load_json(path)), paths))
+
+
 def load_history_rows(path: str | None) -> list[dict[str, object]]:
     if not path:
         return []
-    raw = json.loads(Path(path).read_text(encoding="utf-8"))
+    raw = load_json(Path(path))
     if not isinstance(raw, list):
         raise ValueError("history file must be a JSON array")
 
@@ -45,72 +97,60 @@ def load_history_rows(path: str | None) -> list[dict[str, object]]:
     return rows
 
 
+SUMMARY_TEMPLATE = (
+    "# Nightly Feature Matrix Summary\n"
+    "\n"
+    "- Generated at: `{generated_at}`\n"
+    "- Total lanes: `{total}`\n"
+    "- Passed: `{passed}`\n"
+    "- Failed: `{failed}`"
+)
+LANE_TABLE_HEADER = "| Lane | Status | Exit | Duration (s) | Owner | Command |\n| --- | --- | ---:| ---:| --- | --- |"
+LANE_ROW_TEMPLATE = "| `{lane}` | `{status}` | {exit_code} | {duration_seconds:.3f} | `{owner_display}` | `{command}` |"
+FAILED_LANE_TEMPLATE = "- `{lane}` failed (exit={exit_code}) owner=`{owner_display}`"
+HISTORY_TABLE_HEADER = "| Run | Event | Conclusion | Created At |\n| --- | --- | --- | --- |"
+
+
 def build_markdown(report: dict) -> str:
-    lines: list[str] = []
-    lines.append("# Nightly Feature Matrix Summary")
-    lines.append("")
-    lines.append(f"- Generated at: `{report['generated_at']}`")
-    lines.append(f"- Total lanes: `{report['total']}`")
-    lines.append(f"- Passed: `{report['passed']}`")
-    lines.append(f"- Failed: `{report['failed']}`")
-    lines.append("")
-
-    if not report["rows"]:
-        lines.append("No nightly lane result files found.")
-        lines.append("")
-        return "\n".join(lines)
-
-    lines.append("| Lane | Status | Exit | Duration (s) | Owner | Command |")
-    lines.append("| --- | --- | ---:| ---:| --- | --- |")
-    for row in report["rows"]:
-        lines.append(
-            "| "
-            f"`{row['lane']}` | "
-            f"`{row['status']}` | "
-            f"{row['exit_code']} | "
-            f"{row['duration_seconds']} | "
-            f"`{row['owner'] or 'unassigned'}` | "
-            f"`{row['command']}` |"
-        )
-    lines.append("")
+    # Sections are joined by a blank line; each one is a pre-joined block of lines.
+    sections = [SUMMARY_TEMPLATE.format_map(report)]
 
-    failed_rows = [row for row in report["rows"] if row["status"] != "success"]
+    rows = report["rows"]
+    if not rows:
+        sections.append("No nightly lane result files found.")
+        return "\n\n".join(sections) + "\n"
+
+    display_rows = [{**row, "owner_display": row["owner"] or "unassigned"} for row in rows]
+    format_row = LANE_ROW_TEMPLATE.format_map
+    sections.append(LANE_TABLE_HEADER + "\n" + "\n".join(map(format_row, display_rows)))
+
+    failed_rows = [row for row in display_rows if row["status"] != "success"]
     if failed_rows:
-        lines.append("## Failed Lanes")
-        for row in failed_rows:
-            lines.append(
-                f"- `{row['lane']}` failed (exit={row['exit_code']}) owner=`{row['owner'] or 'unassigned'}`"
-            )
-        lines.append("")
+        format_failed = FAILED_LANE_TEMPLATE.format_map
+        sections.append("## Failed Lanes\n" + "\n".join(map(format_failed, failed_rows)))
 
     trend = report.get("trend_snapshot", {})
     history = trend.get("history_runs", []) if isinstance(trend, dict) else []
     if history:
-        lines.append("## Recent Nightly Runs")
-        lines.append(
-            f"- History pass: `{trend.get('history_passed', 0)}` / `{trend.get('history_total', 0)}`"
-        )
-        lines.append(
-            f"- History fail: `{trend.get('history_failed', 0)}` / `{trend.get('history_total', 0)}`"
-        )
-        lines.append(f"- History pass rate: `{trend.get('history_pass_rate', 0.0)}`")
-        lines.append("")
-        lines.append("| Run | Event | Conclusion | Created At |")
-        lines.append("| --- | --- | --- | --- |")
+        history_lines = []
         for item in history:
             run_id = item.get("run_id", 0)
             url = str(item.get("url", "")).strip()
             run_link = f"[`{run_id}`]({url})" if run_id and url else f"`{run_id}`"
-            lines.append(
-                "| "
-                f"{run_link} | "
-                f"`{item.get('event', '')}` | "
-                f"`{item.get('conclusion', '')}` | "
-                f"`{item.get('created_at', '')}` |"
+            history_lines.append(
+                f"| {run_link} | `{item.get('event', '')}` | "
+                f"`{item.get('conclusion', '')}` | `{item.get('created_at', '')}` |"
             )
-        lines.append("")
+        sections.append(
+            "## Recent Nightly Runs\n"
+            f"- History pass: `{trend.get('history_passed', 0)}` / `{trend.get('history_total', 0)}`\n"
+            f"- History fail: `{trend.get('history_failed', 0)}` / `{trend.get('history_total', 0)}`\n"
+            f"- History pass rate: `{trend.get('history_pass_rate', 0.0)}`\n"
+            "\n"
+            f"{HISTORY_TABLE_HEADER}\n" + "\n".join(history_lines)
+        )
 
-    return "\n".join(lines)
+    return "\n\n".join(sections) + "\n"
 
 
 def main() -> int:
@@ -121,6 +161,11 @@ def main() -> int:
     parser.add_argument("--owners-file", default="")
     parser.add_argument("--history-file", default="")
     parser.add_argument("--fail-on-failure", action="store_true")
+    parser.add_argument(
+        "--exit-only",
+        action="store_true",
+        help="With --fail-on-failure, skip writing report artifacts when any lane failed",
+    )
     args = parser.parse_args()
 
     input_dir = Path(args.input_dir).resolve()
@@ -135,10 +180,16 @@ def main() -> int:
     history_rows = load_history_rows(args.history_file or None)
 
     rows: list[dict[str, object]] = []
-    for path in sorted(input_dir.rglob("nightly-result-*.json")):
-        raw = json.loads(path.read_text(encoding="utf-8"))
+    passed = 0
+    intern = sys.intern
+    lane_results = load_lane_results(sorted(map(Path, iter_lane_result_paths(input_dir))))
+    for path, raw in lane_results:
         lane = str(raw.get("lane", path.stem.replace("nightly-result-", "")))
-        status = str(raw.get("status", "unknown"))
+        # Lane statuses come from a handful of values, so share one string object per distinct status.
+        status_raw = raw.get("status", "unknown")
+        status = intern(status_raw) if isinstance(status_raw, str) else str(status_raw)
+        if status == "success":
+            passed += 1
         exit_code = int(raw.get("exit_code", 1))
         duration = float(raw.get("duration_seconds", 0.0))
         command = str(raw.get("command", ""))
@@ -148,15 +199,18 @@ def main() -> int:
                 "lane": lane,
                 "status": status,
                 "exit_code": exit_code,
-                "duration_seconds": round(duration, 3),
+                "duration_seconds": duration,
                 "command": command,
                 "owner": owners.get(lane, ""),
                 "source": path.relative_to(input_dir).as_posix(),
             }
         )
 
-    passed = sum(1 for row in rows if row["status"] == "success")
     failed = len(rows) - passed
+    if args.exit_only and args.fail_on_failure and failed > 0:
+        print(f"nightly matrix contains failed lanes: {failed}", file=sys.stderr)
+        return 3
+
     history_passed = sum(1 for row in history_rows if str(row.get("conclusion", "")).lower() == "success")
     history_total = len(history_rows)
     history_failed = history_total - history_passed
@@ -164,7 +218,7 @@ def main() -> int:
 
     report = {
         "schema_version": "zeroclaw.nightly-matrix.v1",
-        "generated_at": dt.datetime.now(dt.timezone.utc).isoformat(),
+        "generated_at": dt.datetime.now(UTC).isoformat(),
         "input_dir": str(input_dir),
         "total": len(rows),
         "passed": passed,
@@ -181,8 +235,8 @@ def main() -> int:
 
     output_json.parent.mkdir(parents=True, exist_ok=True)
     output_md.parent.mkdir(parents=True, exist_ok=True)
-    output_json.write_text(json.dumps(report, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
-    output_md.write_text(build_markdown(report), encoding="utf-8")
+    write_json(output_json, report)
+    output_md.write_bytes(build_markdown(report).encode("utf-8"))
 
     if args.fail_on_failure and failed > 0:
         print(f"nightly matrix contains failed lanes: {failed}", file=sys.stderr)
@@ -6,17 +6,53 @@ from __future__ import annotations
 import argparse
 import datetime as dt
 import json
+import os
 import re
 import subprocess
 import sys
+from functools import lru_cache
 from pathlib import Path
 
-STABLE_TAG_RE = re.compile(r"^v(?P<version>\d+\.\d+\.\d+)$")
-PRERELEASE_TAG_RE = re.compile(
-    r"^v(?P<version>\d+\.\d+\.\d+)-(?P<stage>alpha|beta|rc)\.(?P<number>\d+)$"
+try:
+    import tomllib  # Python 3.11+
+except ModuleNotFoundError:  # pragma: no cover
+    import tomli as tomllib  # type: ignore
+
+try:
+    import orjson
+except ImportError:  # optional accelerator; stdlib json is the fallback
+    orjson = None
+
+UTC = dt.timezone.utc
+
+TAG_RE = re.compile(
+    r"^v(?P<version>\d+\.\d+\.\d+)(?:-(?P<stage>alpha|beta|rc)\.(?P<number>\d+))?$"
 )
 STAGE_SEQUENCE = ["alpha", "beta", "rc", "stable"]
 STAGE_RANK = {stage: index + 1 for index, stage in enumerate(STAGE_SEQUENCE)}
+SKIP_FETCH_ENV = "ZEROCLAW_PRERELEASE_SKIP_FETCH"
+SKIP_FETCH_TRUTHY = {"1", "true", "yes"}
+
+
+def load_json(path: Path) -> object:
+    raw = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def write_json(path: Path, payload: object) -> None:
+    if orjson is not None:
+        path.write_bytes(
+            orjson.dumps(
+                payload,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS,
+            )
+        )
+        return
+    with path.open("w", encoding="utf-8") as handle:
+        json.dump(payload, handle, indent=2, ensure_ascii=False)
+        handle.write("\n")
 
 
 def run_git(args: list[str], *, cwd: Path) -> str:
@@ -32,17 +68,54 @@ def run_git(args: list[str], *, cwd: Path) -> str:
     return proc.stdout.strip()
 
 
-def parse_tag(tag: str) -> tuple[str, str, int | None]:
-    stable_match = STABLE_TAG_RE.fullmatch(tag)
-    if stable_match:
-        return (stable_match.group("version"), "stable", None)
+def list_version_tags(version: str, *, cwd: Path) -> dict[str, str]:
+    refs_text = run_git(
+        [
+            "for-each-ref",
+            f"refs/tags/v{version}*",
+            "--format=%(refname:strip=2) %(objecttype) %(objectname) %(*objecttype) %(*objectname)",
+        ],
+        cwd=cwd,
+    )
+    tag_commits: dict[str, str] = {}
+    for line in refs_text.splitlines():
+        fields = line.split()
+        if not fields:
+            continue
+        # `%(*...)` peels a single level; map a tag to "" unless that already lands on a commit.
+        peeled_type, peeled_sha = fields[-2], fields[-1]
+        tag_commits[fields[0]] = peeled_sha if peeled_type == "commit" else ""
+    return tag_commits
+
 
-    pre_match = PRERELEASE_TAG_RE.fullmatch(tag)
-    if pre_match:
+def read_git_blob(spec: str, *, cwd: Path) -> str:
+    proc = subprocess.run(
+        ["git", "cat-file", "--batch"],
+        cwd=str(cwd),
+        input=f"{spec}\n".encode("utf-8"),
+        capture_output=True,
+        check=False,
+    )
+    if proc.returncode != 0:
+        stderr = proc.stderr.decode("utf-8", errors="replace").strip()
+        raise RuntimeError(f"git cat-file --batch failed ({proc.returncode}): {stderr}")
+    header, _, body = proc.stdout.partition(b"\n")
+    fields = header.decode("utf-8", errors="replace").split()
+    if len(fields) != 3 or fields[1] != "blob":
+        raise RuntimeError(f"git cat-file --batch could not read `{spec}`: {' '.join(fields)}")
+    return body[: int(fields[2])].decode("utf-8")
+
+
+@lru_cache(maxsize=4096)
+def parse_tag(tag: str) -> tuple[str, str, int | None]:
+    match = TAG_RE.fullmatch(tag)
+    if match:
+        if match.group("stage") is None:
+            return (match.group("version"), "stable", None)
         return (
-            pre_match.group("version"),
-            pre_match.group("stage"),
-            int(pre_match.group("number")),
+            match.group("version"),
+            match.group("stage"),
+            int(match.group("number")),
         )
 
     raise ValueError(
@@ -186,8 +259,7 @@ def build_markdown(report: dict) -> str:
     lines.append("## Current Stage Required Checks")
     required_checks = report.get("required_checks", [])
     if required_checks:
-        for check_name in required_checks:
-            lines.append(f"- `{check_name}`")
+        lines.extend(f"- `{check_name}`" for check_name in required_checks)
     else:
         lines.append("- none configured")
     lines.append("")
@@ -247,19 +319,23 @@ def build_markdown(report: dict) -> str:
 
     if report["violations"]:
         lines.append("## Violations")
-        for item in report["violations"]:
-            lines.append(f"- {item}")
+        lines.extend(f"- {item}" for item in report["violations"])
         lines.append("")
 
     if report["warnings"]:
         lines.append("## Warnings")
-        for item in report["warnings"]:
-            lines.append(f"- {item}")
+        lines.extend(f"- {item}" for item in report["warnings"])
         lines.append("")
 
     return "\n".join(lines).rstrip() + "\n"
 
 
+def print_violations(violations: list[str]) -> None:
+    print("prerelease guard violations found:", file=sys.stderr)
+    for item in violations:
+        print(f"- {item}", file=sys.stderr)
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Validate release tag stage gating.")
     parser.add_argument("--repo-root", default=".")
@@ -269,57 +345,81 @@ def main() -> int:
     parser.add_argument("--output-json", required=True)
     parser.add_argument("--output-md", required=True)
     parser.add_argument("--fail-on-violation", action="store_true")
+    parser.add_argument(
+        "--exit-only",
+        action="store_true",
+        help="With --fail-on-violation, skip writing report artifacts when violations are found",
+    )
+    parser.add_argument(
+        "--skip-fetch",
+        action="store_true",
+        help=(
+            "Do not run `git fetch origin main --tags` before validation; use when refs were already fetched "
+            f"(also enabled by setting {SKIP_FETCH_ENV} to 1, true, or yes)"
+        ),
+    )
     args = parser.parse_args()
 
     repo_root = Path(args.repo_root).resolve()
     out_json = Path(args.output_json)
     out_md = Path(args.output_md)
 
-    policy = json.loads(Path(args.stage_config_file).read_text(encoding="utf-8"))
-    stage_order, required_prev, required_checks, policy_violations = parse_stage_policy(policy)
-
-    violations: list[str] = []
-    warnings: list[str] = []
-    violations.extend(policy_violations)
-
     try:
         version, stage, stage_number = parse_tag(args.tag)
     except ValueError as exc:
         print(str(exc), file=sys.stderr)
         return 2
 
-    try:
-        run_git(["fetch", "--quiet", "origin", "main", "--tags"], cwd=repo_root)
-    except RuntimeError as exc:
-        warnings.append(f"Failed to refresh origin refs/tags before validation: {exc}")
+    policy = load_json(Path(args.stage_config_file))
+    stage_order, required_prev, required_checks, policy_violations = parse_stage_policy(policy)
 
+    violations: list[str] = []
+    warnings: list[str] = []
+    violations.extend(policy_violations)
+
+    skip_fetch = args.skip_fetch or os.environ.get(SKIP_FETCH_ENV, "").strip().lower() in SKIP_FETCH_TRUTHY
+    if not skip_fetch:
+        try:
+            run_git(["fetch", "--quiet", "origin", "main", "--tags"], cwd=repo_root)
+        except RuntimeError as exc:
+            warnings.append(f"Failed to refresh origin refs/tags before validation: {exc}")
+
+    # Ancestry only needs the tag name, so let it run while the tag listing is collected.
+    ancestry_proc = subprocess.Popen(
+        ["git", "merge-base", "--is-ancestor", f"{args.tag}^{{commit}}", "origin/main"],
+        cwd=str(repo_root),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
     try:
-        tag_sha = run_git(["rev-parse", f"{args.tag}^{{commit}}"], cwd=repo_root)
-    except RuntimeError as exc:
-        violations.append(f"Unable to resolve tag `{args.tag}`: {exc}")
-        tag_sha = ""
+        tag_commits = list_version_tags(version, cwd=repo_root)
+    finally:
+        ancestry_returncode = ancestry_proc.wait()
 
-    if tag_sha:
-        proc = subprocess.run(
-            ["git", "merge-base", "--is-ancestor", tag_sha, "origin/main"],
-            cwd=str(repo_root),
-            text=True,
-            capture_output=True,
-            check=False,
+    tag_sha = tag_commits.get(args.tag, "")
+    if args.tag in tag_commits and not tag_sha:
+        # Nested annotated tags need a full peel that for-each-ref cannot express.
+        try:
+            tag_sha = run_git(["rev-parse", f"{args.tag}^{{commit}}"], cwd=repo_root)
+        except RuntimeError:
+            tag_sha = ""
+    if not tag_sha:
+        violations.append(f"Unable to resolve tag `{args.tag}`: no matching ref under `refs/tags`.")
+    elif ancestry_returncode != 0:
+        violations.append(
+            f"Tag `{args.tag}` ({tag_sha}) is not reachable from `origin/main`; prerelease tags must originate from main."
         )
-        if proc.returncode != 0:
-            violations.append(
-                f"Tag `{args.tag}` ({tag_sha}) is not reachable from `origin/main`; prerelease tags must originate from main."
-            )
 
-    tags_text = run_git(["tag", "--list", f"v{version}*"], cwd=repo_root)
-    all_version_tags = [line.strip() for line in tags_text.splitlines() if line.strip()]
+    all_version_tags = list(tag_commits)
     parsed_entries = parse_stage_entries(all_version_tags)
+    entries_by_stage: dict[str, list[dict[str, object]]] = {}
+    for entry in parsed_entries:
+        entries_by_stage.setdefault(str(entry["stage"]), []).append(entry)
     sibling_entries = [entry for entry in parsed_entries if entry["tag"] != args.tag]
     sibling_tags = [str(entry["tag"]) for entry in sibling_entries]
 
-    sibling_stages = [str(entry["stage"]) for entry in sibling_entries]
-    same_stage_entries = [entry for entry in sibling_entries if entry["stage"] == stage]
+    # The tag under validation can only sit in its own stage bucket; other buckets are all siblings.
+    same_stage_entries = [entry for entry in entries_by_stage.get(stage, []) if entry["tag"] != args.tag]
     same_stage_numbers = [
         int(entry["stage_number"]) for entry in same_stage_entries if entry["stage_number"] is not None
     ]
@@ -342,8 +442,7 @@ def main() -> int:
     prerequisite_stage = required_prev.get(stage)
     prerequisite_tag = None
     if prerequisite_stage:
-        prerequisite_entries = [entry for entry in sibling_entries if entry["stage"] == prerequisite_stage]
-        prerequisite_entry = highest_stage_entry(prerequisite_entries)
+        prerequisite_entry = highest_stage_entry(entries_by_stage.get(prerequisite_stage, []))
         prerequisite_tag = str(prerequisite_entry["tag"]) if prerequisite_entry else None
         if not prerequisite_tag:
             violations.append(
@@ -369,7 +468,7 @@ def main() -> int:
         else:
             transition_type = "stage_iteration"
 
-    if sibling_stages:
+    if sibling_entries:
         if highest_sibling_rank > current_rank:
             violations.append(
                 f"Higher stage tags already exist for `{version}`. Refusing stage regression to `{stage}`."
@@ -378,13 +477,11 @@ def main() -> int:
     cargo_version = ""
     if tag_sha:
         try:
-            cargo_toml = run_git(["show", f"{args.tag}:Cargo.toml"], cwd=repo_root)
-            for line in cargo_toml.splitlines():
-                line = line.strip()
-                if line.startswith("version = "):
-                    cargo_version = line.split('"', 2)[1]
-                    break
-        except RuntimeError as exc:
+            cargo_toml = read_git_blob(f"{args.tag}:Cargo.toml", cwd=repo_root)
+            package = tomllib.loads(cargo_toml).get("package")
+            package_version = package.get("version") if isinstance(package, dict) else None
+            cargo_version = package_version if isinstance(package_version, str) else ""
+        except (RuntimeError, tomllib.TOMLDecodeError) as exc:
             violations.append(f"Failed to inspect Cargo.toml at `{args.tag}`: {exc}")
 
     if cargo_version and cargo_version != version:
@@ -392,6 +489,10 @@ def main() -> int:
             f"Tag `{args.tag}` version `{version}` does not match Cargo.toml version `{cargo_version}` at the same ref."
         )
 
+    if args.exit_only and args.fail_on_violation and violations:
+        print_violations(violations)
+        return 3
+
     transition_outcome = transition_type
     if violations:
         if transition_type == "promotion":
@@ -415,9 +516,7 @@ def main() -> int:
         "version": version,
         "known_tags": [str(entry["tag"]) for entry in parsed_entries],
         "per_stage": {
-            stage_name: [
-                str(entry["tag"]) for entry in parsed_entries if entry["stage"] == stage_name
-            ]
+            stage_name: [str(entry["tag"]) for entry in entries_by_stage.get(stage_name, [])]
             for stage_name in stage_order
         },
         "timeline": parsed_entries,
@@ -429,7 +528,7 @@ def main() -> int:
 
     report = {
         "schema_version": "zeroclaw.prerelease-guard.v2",
-        "generated_at": dt.datetime.now(dt.timezone.utc).isoformat(),
+        "generated_at": dt.datetime.now(UTC).isoformat(),
         "policy_schema_version": policy.get("schema_version"),
         "stage_order": stage_order,
         "tag": args.tag,
@@ -459,13 +558,11 @@ def main() -> int:
 
     out_json.parent.mkdir(parents=True, exist_ok=True)
     out_md.parent.mkdir(parents=True, exist_ok=True)
-    out_json.write_text(json.dumps(report, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
-    out_md.write_text(build_markdown(report), encoding="utf-8")
+    write_json(out_json, report)
+    out_md.write_bytes(build_markdown(report).encode("utf-8"))
 
     if args.fail_on_violation and violations:
-        print("prerelease guard violations found:", file=sys.stderr)
-        for item in violations:
-            print(f"- {item}", file=sys.stderr)
+        print_violations(violations)
         return 3
     return 0
 
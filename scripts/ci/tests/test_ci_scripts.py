@@ -7,6 +7,8 @@ import contextlib
 import hashlib
 import http.server
 import json
+import os
+import re
 import shutil
 import socket
 import socketserver
@@ -2863,6 +2865,163 @@ class CiScriptsBehaviorTest(unittest.TestCase):
         self.assertIn("## Recent Nightly Runs", markdown)
         self.assertIn("example.test/runs/101", markdown)
 
+    def test_nightly_matrix_report_exit_only_skips_artifacts_on_failed_lane(self) -> None:
+        lane_root = self.tmp / "lane-artifacts"
+        lane_root.mkdir(parents=True, exist_ok=True)
+        (lane_root / "nightly-result-nightly-all-features.json").write_text(
+            json.dumps(
+                {
+                    "lane": "nightly-all-features",
+                    "status": "failure",
+                    "exit_code": 101,
+                    "duration_seconds": 47,
+                    "command": "cargo test --all-features",
+                }
+            )
+            + "\n",
+            encoding="utf-8",
+        )
+
+        out_json = self.tmp / "nightly-summary.json"
+        out_md = self.tmp / "nightly-summary.md"
+        base_cmd = [
+            "python3",
+            self._script("nightly_matrix_report.py"),
+            "--input-dir",
+            str(lane_root),
+            "--output-json",
+            str(out_json),
+            "--output-md",
+            str(out_md),
+            "--exit-only",
+        ]
+        proc = run_cmd([*base_cmd, "--fail-on-failure"])
+        self.assertEqual(proc.returncode, 3)
+        self.assertIn("nightly matrix contains failed lanes: 1", proc.stderr)
+        self.assertFalse(out_json.exists())
+        self.assertFalse(out_md.exists())
+
+        proc = run_cmd(base_cmd)
+        self.assertEqual(proc.returncode, 0, msg=proc.stderr)
+        report = json.loads(out_json.read_text(encoding="utf-8"))
+        self.assertEqual(report["failed"], 1)
+        self.assertTrue(out_md.exists())
+
+    def test_nightly_matrix_report_exit_only_writes_artifacts_when_lanes_pass(self) -> None:
+        lane_root = self.tmp / "lane-artifacts"
+        lane_root.mkdir(parents=True, exist_ok=True)
+        (lane_root / "nightly-result-default.json").write_text(
+            json.dumps(
+                {
+                    "lane": "default",
+                    "status": "success",
+                    "exit_code": 0,
+                    "duration_seconds": 12,
+                    "command": "cargo check --locked",
+                }
+            )
+            + "\n",
+            encoding="utf-8",
+        )
+
+        out_json = self.tmp / "nightly-summary.json"
+        out_md = self.tmp / "nightly-summary.md"
+        proc = run_cmd(
+            [
+                "python3",
+                self._script("nightly_matrix_report.py"),
+                "--input-dir",
+                str(lane_root),
+                "--output-json",
+                str(out_json),
+                "--output-md",
+                str(out_md),
+                "--fail-on-failure",
+                "--exit-only",
+            ]
+        )
+        self.assertEqual(proc.returncode, 0, msg=proc.stderr)
+        report = json.loads(out_json.read_text(encoding="utf-8"))
+        self.assertEqual(report["passed"], 1)
+        self.assertTrue(out_md.exists())
+
+    def test_nightly_matrix_report_json_matches_without_orjson(self) -> None:
+        lane_root = self.tmp / "lane-artifacts"
+        (lane_root / "nested").mkdir(parents=True, exist_ok=True)
+        (lane_root / "nightly-result-default.json").write_text(
+            json.dumps(
+                {
+                    "lane": "default",
+                    "status": "success",
+                    "exit_code": 0,
+                    "duration_seconds": 12.3456,
+                    "command": "cargo check --locked # ✓ café",
+                }
+            )
+            + "\n",
+            encoding="utf-8",
+        )
+        (lane_root / "nested" / "nightly-result-all-features.json").write_text(
+            json.dumps(
+                {
+                    "lane": "all-features",
+                    "status": "failure",
+                    "exit_code": 101,
+                    "duration_seconds": 0.1,
+                    "command": "cargo test --all-features",
+                }
+            )
+            + "\n",
+            encoding="utf-8",
+        )
+        history = self.tmp / "history.json"
+        history.write_text(
+            json.dumps(
+                [
+                    {
+                        "run_id": 42,
+                        "url": "https://example.invalid/runs/42",
+                        "event": "schedule",
+                        "conclusion": "success",
+                        "created_at": "2026-01-01T00:00:00Z",
+                        "head_sha": "abc123",
+                        "display_title": "Nightly — ünïcode",
+                    }
+                ]
+            )
+            + "\n",
+            encoding="utf-8",
+        )
+
+        # Block orjson before the script imports it so load_json/write_json take the stdlib path.
+        shim = (
+            "import runpy, sys; sys.modules['orjson'] = None; sys.argv = sys.argv[1:]; "
+            "runpy.run_path(sys.argv[0], run_name='__main__')"
+        )
+        outputs: list[str] = []
+        for label, prefix in (("default", ["python3"]), ("stdlib", ["python3", "-c", shim])):
+            out_json = self.tmp / f"nightly-summary-{label}.json"
+            proc = run_cmd(
+                [
+                    *prefix,
+                    self._script("nightly_matrix_report.py"),
+                    "--input-dir",
+                    str(lane_root),
+                    "--history-file",
+                    str(history),
+                    "--output-json",
+                    str(out_json),
+                    "--output-md",
+                    str(self.tmp / f"nightly-summary-{label}.md"),
+                ]
+            )
+            self.assertEqual(proc.returncode, 0, msg=proc.stderr)
+            text = out_json.read_text(encoding="utf-8")
+            outputs.append(re.sub(r'"generated_at": "[^"]*"', '"generated_at": ""', text))
+
+        self.assertEqual(outputs[0], outputs[1])
+        self.assertIn("café", outputs[1])
+
     def test_canary_guard_promote_when_metrics_within_threshold(self) -> None:
         policy = self.tmp / "canary-policy.json"
         policy.write_text(
@@ -2930,6 +3089,104 @@ class CiScriptsBehaviorTest(unittest.TestCase):
             ["error_rate", "crash_rate", "p95_latency_ms", "sample_size"],
         )
 
+    def test_canary_guard_exit_only_skips_artifacts_on_violation(self) -> None:
+        policy = self.tmp / "canary-policy.json"
+        policy.write_text(
+            json.dumps(
+                {
+                    "schema_version": "zeroclaw.canary-policy.v1",
+                    "minimum_sample_size": 300,
+                    "thresholds": {
+                        "max_error_rate": 0.02,
+                        "max_crash_rate": 0.01,
+                        "max_p95_latency_ms": 1200,
+                    },
+                },
+                indent=2,
+            )
+            + "\n",
+            encoding="utf-8",
+        )
+        out_json = self.tmp / "canary.json"
+        out_md = self.tmp / "canary.md"
+        proc = run_cmd(
+            [
+                "python3",
+                self._script("canary_guard.py"),
+                "--policy-file",
+                str(policy),
+                "--candidate-tag",
+                "v0.2.0-rc.1",
+                "--error-rate",
+                "0.01",
+                "--crash-rate",
+                "0.005",
+                "--p95-latency-ms",
+                "900",
+                "--sample-size",
+                "10",
+                "--output-json",
+                str(out_json),
+                "--output-md",
+                str(out_md),
+                "--fail-on-violation",
+                "--exit-only",
+            ]
+        )
+        self.assertEqual(proc.returncode, 3)
+        self.assertIn("Insufficient sample size", proc.stderr)
+        self.assertFalse(out_json.exists())
+        self.assertFalse(out_md.exists())
+
+    def test_canary_guard_exit_only_writes_artifacts_without_violations(self) -> None:
+        policy = self.tmp / "canary-policy.json"
+        policy.write_text(
+            json.dumps(
+                {
+                    "schema_version": "zeroclaw.canary-policy.v1",
+                    "minimum_sample_size": 300,
+                    "thresholds": {
+                        "max_error_rate": 0.02,
+                        "max_crash_rate": 0.01,
+                        "max_p95_latency_ms": 1200,
+                    },
+                },
+                indent=2,
+            )
+            + "\n",
+            encoding="utf-8",
+        )
+        out_json = self.tmp / "canary.json"
+        out_md = self.tmp / "canary.md"
+        proc = run_cmd(
+            [
+                "python3",
+                self._script("canary_guard.py"),
+                "--policy-file",
+                str(policy),
+                "--candidate-tag",
+                "v0.2.0-rc.1",
+                "--error-rate",
+                "0.01",
+                "--crash-rate",
+                "0.005",
+                "--p95-latency-ms",
+                "900",
+                "--sample-size",
+                "500",
+                "--output-json",
+                str(out_json),
+                "--output-md",
+                str(out_md),
+                "--fail-on-violation",
+                "--exit-only",
+            ]
+        )
+        self.assertEqual(proc.returncode, 0, msg=proc.stderr)
+        report = json.loads(out_json.read_text(encoding="utf-8"))
+        self.assertEqual(report["violations"], [])
+        self.assertTrue(out_md.exists())
+
     def test_prerelease_guard_requires_previous_stage(self) -> None:
         repo = self.tmp / "repo"
         repo.mkdir(parents=True, exist_ok=True)
@@ -3365,6 +3622,540 @@ class CiScriptsBehaviorTest(unittest.TestCase):
         self.assertIn("required_checks.rc", joined)
         self.assertIn("required_checks.stable", joined)
 
+    def test_prerelease_guard_reads_package_version_from_cargo_toml(self) -> None:
+        repo = self.tmp / "repo"
+        repo.mkdir(parents=True, exist_ok=True)
+        run_cmd(["git", "init"], cwd=repo)
+        run_cmd(["git", "config", "user.name", "Test User"], cwd=repo)
+        run_cmd(["git", "config", "user.email", "test@example.com"], cwd=repo)
+
+        cargo = repo / "Cargo.toml"
+        cargo.write_text(
+            textwrap.dedent(
+                """
+                [dependencies.serde]
+                version = "1.0"
+
+                [package]
+                name = "sample"
+                version='0.2.0'
+                edition = "2021"
+                """
+            ).strip()
+            + "\n",
+            encoding="utf-8",
+        )
+        run_cmd(["git", "add", "Cargo.toml"], cwd=repo)
+        run_cmd(["git", "commit", "-m", "init"], cwd=repo)
+        run_cmd(["git", "branch", "-M", "main"], cwd=repo)
+        run_cmd(["git", "tag", "-a", "v0.2.0-alpha.1", "-m", "v0.2.0-alpha.1"], cwd=repo)
+        run_cmd(["git", "remote", "add", "origin", str(repo)], cwd=repo)
+        run_cmd(["git", "fetch", "origin", "main:refs/remotes/origin/main"], cwd=repo)
+
+        stage_cfg = self.tmp / "stage-gates.json"
+        stage_cfg.write_text(
+            json.dumps(
+                {
+                    "schema_version": "zeroclaw.prerelease-stage-gates.v1",
+                    "stage_order": ["alpha", "beta", "rc", "stable"],
+                    "required_previous_stage": {
+                        "beta": "alpha",
+                        "rc": "beta",
+                        "stable": "rc",
+                    },
+                    "required_checks": {
+                        "alpha": ["CI Required Gate"],
+                        "beta": ["CI Required Gate"],
+                        "rc": ["CI Required Gate"],
+                        "stable": ["CI Required Gate"],
+                    },
+                },
+                indent=2,
+            )
+            + "\n",
+            encoding="utf-8",
+        )
+
+        out_json = self.tmp / "prerelease-guard-cargo.json"
+        out_md = self.tmp / "prerelease-guard-cargo.md"
+        proc = run_cmd(
+            [
+                "python3",
+                self._script("prerelease_guard.py"),
+                "--repo-root",
+                str(repo),
+                "--tag",
+                "v0.2.0-alpha.1",
+                "--stage-config-file",
+                str(stage_cfg),
+                "--mode",
+                "publish",
+                "--output-json",
+                str(out_json),
+                "--output-md",
+                str(out_md),
+                "--fail-on-violation",
+            ],
+            cwd=repo,
+        )
+        self.assertEqual(proc.returncode, 0, msg=proc.stderr)
+        report = json.loads(out_json.read_text(encoding="utf-8"))
+        self.assertEqual(report["violations"], [])
+        self.assertTrue(report["ready_to_publish"])
+
+    def test_prerelease_guard_rejects_malformed_tag_before_reading_policy(self) -> None:
+        repo = self.tmp / "not-a-repo"
+        repo.mkdir(parents=True, exist_ok=True)
+
+        out_json = self.tmp / "prerelease-guard-bad-tag.json"
+        out_md = self.tmp / "prerelease-guard-bad-tag.md"
+        proc = run_cmd(
+            [
+                "python3",
+                self._script("prerelease_guard.py"),
+                "--repo-root",
+                str(repo),
+                "--tag",
+                "v0.2.0-gamma.1",
+                "--stage-config-file",
+                str(self.tmp / "missing-stage-gates.json"),
+                "--output-json",
+                str(out_json),
+                "--output-md",
+                str(out_md),
+            ],
+            cwd=repo,
+        )
+        self.assertEqual(proc.returncode, 2)
+        self.assertIn("must be `vX.Y.Z`", proc.stderr)
+        self.assertFalse(out_json.exists())
+        self.assertFalse(out_md.exists())
+
+    def test_prerelease_guard_skip_fetch_uses_local_refs(self) -> None:
+        repo = self.tmp / "repo"
+        repo.mkdir(parents=True, exist_ok=True)
+        run_cmd(["git", "init"], cwd=repo)
+        run_cmd(["git", "config", "user.name", "Test User"], cwd=repo)
+        run_cmd(["git", "config", "user.email", "test@example.com"], cwd=repo)
+
+        cargo = repo / "Cargo.toml"
+        cargo.write_text('[package]\nname = "sample"\nversion = "0.2.0"\n', encoding="utf-8")
+        run_cmd(["git", "add", "Cargo.toml"], cwd=repo)
+        run_cmd(["git", "commit", "-m", "init"], cwd=repo)
+        run_cmd(["git", "branch", "-M", "main"], cwd=repo)
+        run_cmd(["git", "tag", "-a", "v0.2.0-alpha.1", "-m", "v0.2.0-alpha.1"], cwd=repo)
+        run_cmd(["git", "remote", "add", "origin", str(repo)], cwd=repo)
+        run_cmd(["git", "fetch", "origin", "main:refs/remotes/origin/main"], cwd=repo)
+        run_cmd(["git", "remote", "set-url", "origin", str(self.tmp / "missing-remote")], cwd=repo)
+
+        stage_cfg = self.tmp / "stage-gates.json"
+        stage_cfg.write_text(
+            json.dumps(
+                {
+                    "schema_version": "zeroclaw.prerelease-stage-gates.v1",
+                    "stage_order": ["alpha", "beta", "rc", "stable"],
+                    "required_previous_stage": {
+                        "beta": "alpha",
+                        "rc": "beta",
+                        "stable": "rc",
+                    },
+                    "required_checks": {
+                        "alpha": ["CI Required Gate"],
+                        "beta": ["CI Required Gate"],
+                        "rc": ["CI Required Gate"],
+                        "stable": ["CI Required Gate"],
+                    },
+                },
+                indent=2,
+            )
+            + "\n",
+            encoding="utf-8",
+        )
+
+        out_json = self.tmp / "prerelease-guard-skip-fetch.json"
+        out_md = self.tmp / "prerelease-guard-skip-fetch.md"
+        proc = run_cmd(
+            [
+                "python3",
+                self._script("prerelease_guard.py"),
+                "--repo-root",
+                str(repo),
+                "--tag",
+                "v0.2.0-alpha.1",
+                "--stage-config-file",
+                str(stage_cfg),
+                "--mode",
+                "publish",
+                "--output-json",
+                str(out_json),
+                "--output-md",
+                str(out_md),
+                "--fail-on-violation",
+                "--skip-fetch",
+            ],
+            cwd=repo,
+        )
+        self.assertEqual(proc.returncode, 0, msg=proc.stderr)
+        report = json.loads(out_json.read_text(encoding="utf-8"))
+        self.assertEqual(report["warnings"], [])
+        self.assertTrue(report["tag_sha"])
+
+    def test_prerelease_guard_skip_fetch_env_var_uses_local_refs(self) -> None:
+        repo = self.tmp / "repo"
+        repo.mkdir(parents=True, exist_ok=True)
+        run_cmd(["git", "init"], cwd=repo)
+        run_cmd(["git", "config", "user.name", "Test User"], cwd=repo)
+        run_cmd(["git", "config", "user.email", "test@example.com"], cwd=repo)
+
+        cargo = repo / "Cargo.toml"
+        cargo.write_text('[package]\nname = "sample"\nversion = "0.2.0"\n', encoding="utf-8")
+        run_cmd(["git", "add", "Cargo.toml"], cwd=repo)
+        run_cmd(["git", "commit", "-m", "init"], cwd=repo)
+        run_cmd(["git", "branch", "-M", "main"], cwd=repo)
+        run_cmd(["git", "tag", "-a", "v0.2.0-alpha.1", "-m", "v0.2.0-alpha.1"], cwd=repo)
+        run_cmd(["git", "remote", "add", "origin", str(repo)], cwd=repo)
+        run_cmd(["git", "fetch", "origin", "main:refs/remotes/origin/main"], cwd=repo)
+        run_cmd(["git", "remote", "set-url", "origin", str(self.tmp / "missing-remote")], cwd=repo)
+
+        stage_cfg = self.tmp / "stage-gates.json"
+        stage_cfg.write_text(
+            json.dumps(
+                {
+                    "schema_version": "zeroclaw.prerelease-stage-gates.v1",
+                    "stage_order": ["alpha", "beta", "rc", "stable"],
+                    "required_previous_stage": {
+                        "beta": "alpha",
+                        "rc": "beta",
+                        "stable": "rc",
+                    },
+                    "required_checks": {
+                        "alpha": ["CI Required Gate"],
+                        "beta": ["CI Required Gate"],
+                        "rc": ["CI Required Gate"],
+                        "stable": ["CI Required Gate"],
+                    },
+                },
+                indent=2,
+            )
+            + "\n",
+            encoding="utf-8",
+        )
+
+        out_json = self.tmp / "prerelease-guard-skip-fetch-env.json"
+        out_md = self.tmp / "prerelease-guard-skip-fetch-env.md"
+        cmd = [
+            "python3",
+            self._script("prerelease_guard.py"),
+            "--repo-root",
+            str(repo),
+            "--tag",
+            "v0.2.0-alpha.1",
+            "--stage-config-file",
+            str(stage_cfg),
+            "--mode",
+            "publish",
+            "--output-json",
+            str(out_json),
+            "--output-md",
+            str(out_md),
+        ]
+        proc = run_cmd(cmd, cwd=repo, env={**os.environ, "ZEROCLAW_PRERELEASE_SKIP_FETCH": "true"})
+        self.assertEqual(proc.returncode, 0, msg=proc.stderr)
+        report = json.loads(out_json.read_text(encoding="utf-8"))
+        self.assertEqual(report["warnings"], [])
+
+        proc = run_cmd(cmd, cwd=repo, env={**os.environ, "ZEROCLAW_PRERELEASE_SKIP_FETCH": "no"})
+        self.assertEqual(proc.returncode, 0, msg=proc.stderr)
+        report = json.loads(out_json.read_text(encoding="utf-8"))
+        self.assertIn("Failed to refresh origin refs/tags", "\n".join(report["warnings"]))
+
+    def test_prerelease_guard_peels_nested_annotated_tag_to_commit(self) -> None:
+        repo = self.tmp / "repo"
+        repo.mkdir(parents=True, exist_ok=True)
+        run_cmd(["git", "init"], cwd=repo)
+        run_cmd(["git", "config", "user.name", "Test User"], cwd=repo)
+        run_cmd(["git", "config", "user.email", "test@example.com"], cwd=repo)
+
+        cargo = repo / "Cargo.toml"
+        cargo.write_text('[package]\nname = "sample"\nversion = "0.2.0"\n', encoding="utf-8")
+        run_cmd(["git", "add", "Cargo.toml"], cwd=repo)
+        run_cmd(["git", "commit", "-m", "init"], cwd=repo)
+        run_cmd(["git", "branch", "-M", "main"], cwd=repo)
+        run_cmd(["git", "tag", "-a", "v0.2.0-alpha.1", "-m", "v0.2.0-alpha.1"], cwd=repo)
+        run_cmd(["git", "tag", "-a", "v0.2.0-alpha.2", "-m", "v0.2.0-alpha.2", "v0.2.0-alpha.1"], cwd=repo)
+        run_cmd(["git", "remote", "add", "origin", str(repo)], cwd=repo)
+        run_cmd(["git", "fetch", "origin", "main:refs/remotes/origin/main"], cwd=repo)
+
+        stage_cfg = self.tmp / "stage-gates.json"
+        stage_cfg.write_text(
+            json.dumps(
+                {
+                    "schema_version": "zeroclaw.prerelease-stage-gates.v1",
+                    "stage_order": ["alpha", "beta", "rc", "stable"],
+                    "required_previous_stage": {
+                        "beta": "alpha",
+                        "rc": "beta",
+                        "stable": "rc",
+                    },
+                    "required_checks": {
+                        "alpha": ["CI Required Gate"],
+                        "beta": ["CI Required Gate"],
+                        "rc": ["CI Required Gate"],
+                        "stable": ["CI Required Gate"],
+                    },
+                },
+                indent=2,
+            )
+            + "\n",
+            encoding="utf-8",
+        )
+
+        out_json = self.tmp / "prerelease-guard-nested-tag.json"
+        out_md = self.tmp / "prerelease-guard-nested-tag.md"
+        proc = run_cmd(
+            [
+                "python3",
+                self._script("prerelease_guard.py"),
+                "--repo-root",
+                str(repo),
+                "--tag",
+                "v0.2.0-alpha.2",
+                "--stage-config-file",
+                str(stage_cfg),
+                "--mode",
+                "publish",
+                "--output-json",
+                str(out_json),
+                "--output-md",
+                str(out_md),
+                "--skip-fetch",
+            ],
+            cwd=repo,
+        )
+        self.assertEqual(proc.returncode, 0, msg=proc.stderr)
+        report = json.loads(out_json.read_text(encoding="utf-8"))
+        commit_sha = run_cmd(["git", "rev-parse", "v0.2.0-alpha.2^{commit}"], cwd=repo).stdout.strip()
+        self.assertEqual(report["tag_sha"], commit_sha)
+        self.assertEqual(report["violations"], [])
+
+    def test_prerelease_guard_flags_tag_not_reachable_from_main(self) -> None:
+        repo = self.tmp / "repo"
+        repo.mkdir(parents=True, exist_ok=True)
+        run_cmd(["git", "init"], cwd=repo)
+        run_cmd(["git", "config", "user.name", "Test User"], cwd=repo)
+        run_cmd(["git", "config", "user.email", "test@example.com"], cwd=repo)
+
+        cargo = repo / "Cargo.toml"
+        cargo.write_text('[package]\nname = "sample"\nversion = "0.2.0"\n', encoding="utf-8")
+        run_cmd(["git", "add", "Cargo.toml"], cwd=repo)
+        run_cmd(["git", "commit", "-m", "init"], cwd=repo)
+        run_cmd(["git", "branch", "-M", "main"], cwd=repo)
+        run_cmd(["git", "remote", "add", "origin", str(repo)], cwd=repo)
+        run_cmd(["git", "fetch", "origin", "main:refs/remotes/origin/main"], cwd=repo)
+        run_cmd(["git", "checkout", "-b", "side"], cwd=repo)
+        run_cmd(["git", "commit", "--allow-empty", "-m", "side"], cwd=repo)
+        run_cmd(["git", "tag", "-a", "v0.2.0-alpha.1", "-m", "v0.2.0-alpha.1"], cwd=repo)
+        tag_sha = run_cmd(["git", "rev-parse", "v0.2.0-alpha.1^{commit}"], cwd=repo).stdout.strip()
+
+        stage_cfg = self.tmp / "stage-gates.json"
+        stage_cfg.write_text(
+            json.dumps(
+                {
+                    "schema_version": "zeroclaw.prerelease-stage-gates.v1",
+                    "stage_order": ["alpha", "beta", "rc", "stable"],
+                    "required_previous_stage": {
+                        "beta": "alpha",
+                        "rc": "beta",
+                        "stable": "rc",
+                    },
+                    "required_checks": {
+                        "alpha": ["CI Required Gate"],
+                        "beta": ["CI Required Gate"],
+                        "rc": ["CI Required Gate"],
+                        "stable": ["CI Required Gate"],
+                    },
+                },
+                indent=2,
+            )
+            + "\n",
+            encoding="utf-8",
+        )
+
+        out_json = self.tmp / "prerelease-guard-off-main.json"
+        out_md = self.tmp / "prerelease-guard-off-main.md"
+        proc = run_cmd(
+            [
+                "python3",
+                self._script("prerelease_guard.py"),
+                "--repo-root",
+                str(repo),
+                "--tag",
+                "v0.2.0-alpha.1",
+                "--stage-config-file",
+                str(stage_cfg),
+                "--mode",
+                "publish",
+                "--output-json",
+                str(out_json),
+                "--output-md",
+                str(out_md),
+                "--skip-fetch",
+            ],
+            cwd=repo,
+        )
+        self.assertEqual(proc.returncode, 0, msg=proc.stderr)
+        report = json.loads(out_json.read_text(encoding="utf-8"))
+        self.assertEqual(
+            report["violations"],
+            [
+                f"Tag `v0.2.0-alpha.1` ({tag_sha}) is not reachable from `origin/main`; "
+                "prerelease tags must originate from main."
+            ],
+        )
+
+    def test_prerelease_guard_flags_missing_cargo_toml_at_tag(self) -> None:
+        repo = self.tmp / "repo"
+        repo.mkdir(parents=True, exist_ok=True)
+        run_cmd(["git", "init"], cwd=repo)
+        run_cmd(["git", "config", "user.name", "Test User"], cwd=repo)
+        run_cmd(["git", "config", "user.email", "test@example.com"], cwd=repo)
+
+        (repo / "README.md").write_text("sample\n", encoding="utf-8")
+        run_cmd(["git", "add", "README.md"], cwd=repo)
+        run_cmd(["git", "commit", "-m", "init"], cwd=repo)
+        run_cmd(["git", "branch", "-M", "main"], cwd=repo)
+        run_cmd(["git", "tag", "-a", "v0.2.0-alpha.1", "-m", "v0.2.0-alpha.1"], cwd=repo)
+        run_cmd(["git", "remote", "add", "origin", str(repo)], cwd=repo)
+        run_cmd(["git", "fetch", "origin", "main:refs/remotes/origin/main"], cwd=repo)
+
+        stage_cfg = self.tmp / "stage-gates.json"
+        stage_cfg.write_text(
+            json.dumps(
+                {
+                    "schema_version": "zeroclaw.prerelease-stage-gates.v1",
+                    "stage_order": ["alpha", "beta", "rc", "stable"],
+                    "required_previous_stage": {
+                        "beta": "alpha",
+                        "rc": "beta",
+                        "stable": "rc",
+                    },
+                    "required_checks": {
+                        "alpha": ["CI Required Gate"],
+                        "beta": ["CI Required Gate"],
+                        "rc": ["CI Required Gate"],
+                        "stable": ["CI Required Gate"],
+                    },
+                },
+                indent=2,
+            )
+            + "\n",
+            encoding="utf-8",
+        )
+
+        out_json = self.tmp / "prerelease-guard-missing-cargo.json"
+        out_md = self.tmp / "prerelease-guard-missing-cargo.md"
+        proc = run_cmd(
+            [
+                "python3",
+                self._script("prerelease_guard.py"),
+                "--repo-root",
+                str(repo),
+                "--tag",
+                "v0.2.0-alpha.1",
+                "--stage-config-file",
+                str(stage_cfg),
+                "--mode",
+                "publish",
+                "--output-json",
+                str(out_json),
+                "--output-md",
+                str(out_md),
+                "--skip-fetch",
+            ],
+            cwd=repo,
+        )
+        self.assertEqual(proc.returncode, 0, msg=proc.stderr)
+        report = json.loads(out_json.read_text(encoding="utf-8"))
+        self.assertEqual(
+            report["violations"],
+            [
+                "Failed to inspect Cargo.toml at `v0.2.0-alpha.1`: git cat-file --batch could not read "
+                "`v0.2.0-alpha.1:Cargo.toml`: v0.2.0-alpha.1:Cargo.toml missing"
+            ],
+        )
+
+    def test_prerelease_guard_exit_only_skips_artifacts_on_violation(self) -> None:
+        repo = self.tmp / "repo"
+        repo.mkdir(parents=True, exist_ok=True)
+        run_cmd(["git", "init"], cwd=repo)
+        run_cmd(["git", "config", "user.name", "Test User"], cwd=repo)
+        run_cmd(["git", "config", "user.email", "test@example.com"], cwd=repo)
+
+        cargo = repo / "Cargo.toml"
+        cargo.write_text('[package]\nname = "sample"\nversion = "0.2.0"\n', encoding="utf-8")
+        run_cmd(["git", "add", "Cargo.toml"], cwd=repo)
+        run_cmd(["git", "commit", "-m", "init"], cwd=repo)
+        run_cmd(["git", "branch", "-M", "main"], cwd=repo)
+        run_cmd(["git", "tag", "-a", "v0.2.0-rc.1", "-m", "v0.2.0-rc.1"], cwd=repo)
+        run_cmd(["git", "remote", "add", "origin", str(repo)], cwd=repo)
+        run_cmd(["git", "fetch", "origin", "main:refs/remotes/origin/main"], cwd=repo)
+
+        stage_cfg = self.tmp / "stage-gates.json"
+        stage_cfg.write_text(
+            json.dumps(
+                {
+                    "schema_version": "zeroclaw.prerelease-stage-gates.v1",
+                    "stage_order": ["alpha", "beta", "rc", "stable"],
+                    "required_previous_stage": {
+                        "beta": "alpha",
+                        "rc": "beta",
+                        "stable": "rc",
+                    },
+                    "required_checks": {
+                        "alpha": ["CI Required Gate"],
+                        "beta": ["CI Required Gate"],
+                        "rc": ["CI Required Gate"],
+                        "stable": ["CI Required Gate"],
+                    },
+                },
+                indent=2,
+            )
+            + "\n",
+            encoding="utf-8",
+        )
+
+        out_json = self.tmp / "prerelease-guard-exit-only.json"
+        out_md = self.tmp / "prerelease-guard-exit-only.md"
+        base_cmd = [
+            "python3",
+            self._script("prerelease_guard.py"),
+            "--repo-root",
+            str(repo),
+            "--tag",
+            "v0.2.0-rc.1",
+            "--stage-config-file",
+            str(stage_cfg),
+            "--mode",
+            "publish",
+            "--output-json",
+            str(out_json),
+            "--output-md",
+            str(out_md),
+            "--skip-fetch",
+            "--exit-only",
+        ]
+        proc = run_cmd([*base_cmd, "--fail-on-violation"], cwd=repo)
+        self.assertEqual(proc.returncode, 3)
+        self.assertIn("requires at least one `beta` tag", proc.stderr)
+        self.assertFalse(out_json.exists())
+        self.assertFalse(out_md.exists())
+
+        proc = run_cmd(base_cmd, cwd=repo)
+        self.assertEqual(proc.returncode, 0, msg=proc.stderr)
+        report = json.loads(out_json.read_text(encoding="utf-8"))
+        self.assertIn("requires at least one `beta` tag", "\n".join(report["violations"]))
+        self.assertTrue(out_md.exists())
+
 
 if __name__ == "__main__":  # pragma: no cover
     unittest.main(verbosity=2)